@@ -2,8 +2,8 @@
 from __future__ import annotations
 from abc import abstractmethod, ABC
 from asyncio import gather
-from importlib import import_module
-from typing import Any, Iterable, Type
+from functools import lru_cache
+from typing import Any, Callable, Iterable, Type
 from jhalog import AsyncLogger
 from aio_lambda_api.json import dumps
 from aio_lambda_api._requests import Request
@@ -75,14 +75,30 @@ class BackendBase(ABC):
         Returns:
             Serialized response.
         """
-        return gather(
-            *(
-                self.serialize_response(response, request)
-                for response, request in resp_req
-            )
+        items = tuple(resp_req)
+        if len(items) == 1:
+            return [await self.serialize_response(*items[0])]
+        return await gather(
+            *(self.serialize_response(response, request) for response, request in items)
         )
 
 
+def _aws_lambda() -> Type[BackendBase]:
+    """AWS lambda backend.
+
+    Returns:
+        Backend class.
+    """
+    from aio_lambda_api._backends.aws_lambda import Backend
+
+    return Backend
+
+
+# Backends are imported only when used
+_BACKENDS: dict[str, Callable[[], Type[BackendBase]]] = {"aws_lambda": _aws_lambda}
+
+
+@lru_cache(maxsize=None)
 def get_backend(name: str | None) -> Type[BackendBase]:
     """Import backend.
 
@@ -93,13 +109,8 @@ def get_backend(name: str | None) -> Type[BackendBase]:
         Backend class.
     """
     name = name or BACKEND
-    element = f"{__name__}.{name}"
     try:
-        module = import_module(element)
-    except ImportError:
-        from importlib.util import find_spec
-
-        if find_spec(element) is not None:  # pragma: no cover
-            raise
+        loader = _BACKENDS[name]
+    except KeyError:
         raise NotImplementedError(f"Unsupported backend: {name}")
-    return getattr(module, "Backend")  # type: ignore
+    return loader()
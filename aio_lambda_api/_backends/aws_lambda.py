@@ -1,18 +1,31 @@
 """AWS lambda backend."""
 from __future__ import annotations
-from base64 import b64decode, b64encode
+from binascii import a2b_base64, b2a_base64
 from os import getenv
-from typing import Any, TYPE_CHECKING, Generator, Iterable
-from jhalog.exception_handlers.botocore import get_status_from_botocore_error
+from typing import Any, TYPE_CHECKING, Callable, Generator, Iterable
 from aio_lambda_api.json import loads
 from aio_lambda_api._backends import BackendBase
-from aio_lambda_api._requests import Request as _Request
+from aio_lambda_api._requests import Request as _Request, _loads_json, _UNSET
 from aio_lambda_api._responses import Response
 
 if TYPE_CHECKING:  # pragma: no cover
     from botocore.client import Config
 
 
+def _get_status_from_botocore_error(*args: Any, **kwargs: Any) -> Any:
+    """Botocore exceptions handler for logger.
+
+    Botocore is imported only when the first exception is handled, to keep it
+    out of the cold start if not used.
+
+    Returns:
+        Handler result.
+    """
+    from jhalog.exception_handlers.botocore import get_status_from_botocore_error
+
+    return get_status_from_botocore_error(*args, **kwargs)
+
+
 class Request(_Request):
     """AWS lambda request.
 
@@ -41,8 +54,11 @@ class Request(_Request):
             method = http["method"]
             path = http["path"]
         headers = event.get("headers") or dict()
+        if event.get("version") != "2.0":
+            # AWS API Gateway HTTP API (Payload 2.0) headers are already lowercase
+            headers = {key.lower(): value for key, value in headers.items()}
         try:
-            headers.setdefault("x-request-id", event["requestContext"]["requestId"])
+            headers.setdefault("x-request-id", request_context["requestId"])
         except KeyError:
             pass
 
@@ -52,6 +68,7 @@ class Request(_Request):
             method=method,
             headers=headers,
             raises_exceptions=raises_exceptions,
+            lowercase_headers=False,
         )
 
     async def body(self) -> bytes | None:
@@ -60,16 +77,32 @@ class Request(_Request):
         Returns:
             Body.
         """
-        try:
-            return self._body
-        except AttributeError:
+        if self._body is _UNSET:
             body = self.event.get("body")
             if body is not None:
-                body = body.encode()
                 if self.event.get("isBase64Encoded", False):
-                    body = b64decode(body)
+                    body = a2b_base64(body)
+                else:
+                    body = body.encode()
             self._body = body
-            return body  # type: ignore
+        return self._body  # type: ignore
+
+    async def json(self) -> Any:
+        """JSON body.
+
+        Text bodies are deserialized directly from the event, without being
+        encoded to bytes first.
+
+        Returns:
+            JSON deserialized body.
+        """
+        if self._json is _UNSET:
+            body = self.event.get("body")
+            if body is None or self.event.get("isBase64Encoded", False):
+                return await _Request.json(self)
+            value = _loads_json(body)
+            self._json = await self.body() if value is _UNSET else value
+        return self._json
 
     @property
     def server_id(self) -> str:
@@ -88,7 +121,7 @@ class Backend(BackendBase):
 
     def __init__(self, *args: Any, **kwargs: Any) -> None:
         super().__init__(*args, **kwargs)
-        self._logger.add_exception_handler(get_status_from_botocore_error)
+        self._logger.add_exception_handler(_get_status_from_botocore_error)
 
     async def parse_request(  # type: ignore
         self, event: dict[str, Any], context: Any
@@ -114,15 +147,16 @@ class Backend(BackendBase):
                 event_source = event["Records"][0]["eventSource"]
             except (IndexError, KeyError):
                 return []
+        parser = self._PARSERS.get(event_source.partition(":")[2])
+        if parser is None:
+            raise NotImplementedError(f"Unsupported event source: {event_source}")
         return [
             Request(
                 record_event,
                 context,
                 raises_exceptions=record_event.get("eventRaisesExceptions", True),
             )
-            for record_event in getattr(
-                self, f"_parse_event_{event_source.split(':', 1)[1]}"
-            )(event)
+            for record_event in parser(event)
         ]
 
     @staticmethod
@@ -203,6 +237,23 @@ class Backend(BackendBase):
             )
         return None
 
+    _PARSERS: dict[
+        str, Callable[[dict[str, Any]], Generator[dict[str, Any], None, None]]
+    ] = {
+        "mq": _parse_event_mq.__func__,  # type: ignore
+        "sns": _parse_event_sns.__func__,  # type: ignore
+        "sqs": _parse_event_sqs.__func__,  # type: ignore
+    }
+
+    _SERIALIZERS: dict[
+        str,
+        Callable[
+            [Iterable[tuple[Response, Request]]], dict[str, list[dict[str, str]]] | None
+        ],
+    ] = {
+        "sqs": _serialize_event_sqs.__func__,  # type: ignore
+    }
+
     async def serialize_response(self, response: Response, request: _Request) -> Any:
         """Serialize response.
 
@@ -216,14 +267,14 @@ class Backend(BackendBase):
         is_base64_encoded = False
         body = await response.body()
         if isinstance(body, (bytes, bytearray, memoryview)):
-            body = b64encode(body).decode()
+            body = b2a_base64(body, newline=False).decode("ascii")
             is_base64_encoded = True
-        return dict(
-            body=body,
-            statusCode=str(response.status_code),
-            headers=response.headers,
-            isBase64Encoded=is_base64_encoded,
-        )
+        return {
+            "body": body,
+            "statusCode": str(response.status_code),
+            "headers": response.headers,
+            "isBase64Encoded": is_base64_encoded,
+        }
 
     async def serialize_responses(  # type: ignore
         self, resp_req: Iterable[tuple[Response, Request]]
@@ -241,13 +292,13 @@ class Backend(BackendBase):
             first_req = resp_req[0][1]
         except IndexError:
             return None
-        name = f"_serialize_event_{first_req.event['eventSource'].split(':', 1)[1]}"
-        try:
-            method = getattr(self, name)
-        except AttributeError:
+        serializer = self._SERIALIZERS.get(
+            first_req.event["eventSource"].partition(":")[2]
+        )
+        if serializer is None:
             # Some services do not check returned data
             return None
-        return method(resp_req)
+        return serializer(resp_req)
 
     @classmethod
     def botocore_config(cls, speedup: bool = True) -> "Config":
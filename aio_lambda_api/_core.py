@@ -2,7 +2,6 @@
 from __future__ import annotations
 from asyncio import new_event_loop, wait_for, gather
 from contextlib import AsyncExitStack
-from inspect import signature
 from typing import (
     Any,
     AsyncContextManager,
@@ -10,14 +9,21 @@ from typing import (
     Callable,
     Iterable,
     Coroutine,
+    Sequence,
     Type,
 )
 from jhalog import LogEvent
 
 try:
-    from pydantic import validate_arguments
+    # Pydantic >= 2: Validator compiled once by pydantic-core
+    from pydantic import (  # type: ignore[attr-defined]
+        validate_call as validate_arguments,
+    )
 except ImportError:
-    validate_arguments = None  # type: ignore
+    try:
+        from pydantic import validate_arguments
+    except ImportError:
+        validate_arguments = None
 
 from aio_lambda_api.exceptions import HTTPException, ValidationError
 from aio_lambda_api._responses import Response, JSONResponse
@@ -34,7 +40,13 @@ _VALIDATOR_CONFIG = dict(arbitrary_types_allowed=True)
 class _APIRoute:
     """API route."""
 
-    __slots__ = ["status_code", "func", "params"]
+    __slots__ = [
+        "status_code",
+        "func",
+        "request_params",
+        "response_params",
+        "needs_copy",
+    ]
 
     def __init__(
         self,
@@ -44,7 +56,15 @@ class _APIRoute:
     ) -> None:
         self.status_code = status_code
         self.func = func
-        self.params = params
+        # Injected parameters names are resolved once per route
+        self.request_params = tuple(
+            name for name, cls in params.items() if cls is Request
+        )
+        self.response_params = tuple(
+            name for name, cls in params.items() if cls is Response
+        )
+        # The body must only be copied if parameters are injected in it
+        self.needs_copy = bool(params)
 
 
 def get_logger() -> LogEvent:
@@ -59,14 +79,15 @@ def get_logger() -> LogEvent:
 class Handler:
     """Serverless function handler."""
 
-    __slots__ = ["_loop", "_exit_stack", "_routes", "_backend"]
+    __slots__ = ["_loop", "_exit_stack", "_routes", "_paths", "_backend"]
 
     def __init__(
         self, backend: str | None = None, jhalog_config: dict[str, Any] | None = None
     ) -> None:
         self._loop = new_event_loop()
         self._exit_stack = AsyncExitStack()
-        self._routes: dict[str, dict[str, _APIRoute]] = dict()
+        self._routes: dict[tuple[str, str], _APIRoute] = dict()
+        self._paths: set[str] = set()
         self._backend = self.enter_async_context(
             get_backend(backend)(jhalog_config=jhalog_config)
         )
@@ -97,7 +118,7 @@ class Handler:
             zip(await self._handle_requests(parsed), parsed)
         )
 
-    async def _handle_requests(self, requests: Iterable[Request]) -> Iterable[Response]:
+    async def _handle_requests(self, requests: Sequence[Request]) -> Iterable[Response]:
         """Handle multiples requests.
 
         Args:
@@ -106,6 +127,10 @@ class Handler:
         Returns:
             Responses.
         """
+        if len(requests) == 1:
+            return [await self._handle_request(requests[0])]
+        # Each task must run in its own context copy: the log event of each request
+        # is stored in a context variable.
         return await gather(*(self._handle_request(request) for request in requests))
 
     async def _handle_request(self, request: Request) -> Response:
@@ -163,24 +188,23 @@ class Handler:
         Returns:
             Default response object, Route function coroutine.
         """
-        try:
-            path_routes = self._routes[request.path]
-        except KeyError:
-            raise HTTPException(404)
-        try:
-            route = path_routes[request.method]
-        except KeyError:
-            raise HTTPException(405)
+        route = self._routes.get((request.path, request.method))
+        if route is None:
+            raise HTTPException(405 if request.path in self._paths else 404)
 
         response = JSONResponse(status_code=route.status_code)
 
         body = await request.json()
+        if not route.needs_copy:
+            return response, (
+                route.func(**body) if isinstance(body, dict) else route.func()
+            )
+
         kwargs = body.copy() if isinstance(body, dict) else dict()
-        for param_name, param_cls in route.params.items():
-            if param_cls == Request:
-                kwargs[param_name] = request
-            elif param_cls == Response:
-                kwargs[param_name] = response
+        for param_name in route.request_params:
+            kwargs[param_name] = request
+        for param_name in route.response_params:
+            kwargs[param_name] = response
 
         return response, route.func(**kwargs)
 
@@ -261,21 +285,14 @@ class Handler:
             """
             params = self._check_signature(func)
             if validate_arguments is not None:
-                func = validate_arguments(  # type: ignore
-                    func, config=_VALIDATOR_CONFIG
-                )
-            try:
-                path_routes = self._routes[path]
-            except KeyError:
-                path_routes = self._routes[path] = dict()
-            try:
-                path_routes[method]
-            except KeyError:
-                path_routes[method] = _APIRoute(
-                    func=func, status_code=status_code or 200, params=params
-                )
-            else:
+                func = validate_arguments(func, config=_VALIDATOR_CONFIG)
+            key = (path, method)
+            if key in self._routes:
                 raise ValueError(f'Route already registered: {method} "{path}".')
+            self._routes[key] = _APIRoute(
+                func=func, status_code=status_code or 200, params=params
+            )
+            self._paths.add(path)
             return func
 
         return decorator
@@ -291,12 +308,13 @@ class Handler:
             Parameters to inject.
         """
         params: dict[str, Type[Any]] = dict()
-        for param in signature(func).parameters.values():
-            annotation = param.annotation
-            if isinstance(annotation, type) and issubclass(annotation, Request):
-                params[param.name] = Request
-            elif isinstance(annotation, type) and issubclass(annotation, Response):
-                params[param.name] = Response
+        for name, annotation in getattr(func, "__annotations__", {}).items():
+            if name == "return" or not isinstance(annotation, type):
+                continue
+            elif issubclass(annotation, Request):
+                params[name] = Request
+            elif issubclass(annotation, Response):
+                params[name] = Response
         return params
 
     def delete(
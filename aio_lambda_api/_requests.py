@@ -3,9 +3,42 @@ from __future__ import annotations
 from typing import Any
 from aio_lambda_api.json import loads, JSONDecodeError
 
+# Lazy attribute not computed yet
+_UNSET: Any = object()
+
+# Characters that can start a JSON document, as str and as bytes items
+_JSON_START_CHARS = '{["-0123456789tfn \t\n\r'
+_JSON_START = frozenset(_JSON_START_CHARS) | frozenset(_JSON_START_CHARS.encode())
+
+
+def _loads_json(body: Any) -> Any:
+    """Deserialize body if it is a JSON document.
+
+    Args:
+        body: Body, str or bytes.
+
+    Returns:
+        Deserialized body, or _UNSET if body is not JSON.
+    """
+    if body and body[0] in _JSON_START:
+        try:
+            return loads(body)
+        except JSONDecodeError:
+            pass
+    return _UNSET
+
 
 class Request:
-    """Request."""
+    """Request.
+
+    Args:
+        path: HTTP path.
+        method: HTTP method.
+        headers: HTTP headers.
+        body: Body.
+        raises_exceptions: If True, raises exceptions.
+        lowercase_headers: If False, headers keys are considered already lowercase.
+    """
 
     __slots__ = ["_headers", "_body", "_json", "_path", "_method", "_raises_exceptions"]
 
@@ -16,14 +49,16 @@ class Request:
         headers: dict[str, str] | None = None,
         body: bytes | None = None,
         raises_exceptions: bool = False,
+        lowercase_headers: bool = True,
     ) -> None:
-        self._headers = (
-            {key.lower(): value for key, value in headers.items()}
-            if headers
-            else dict()
-        )
-        if body is not None:
-            self._body = body
+        if not headers:
+            self._headers: dict[str, str] = dict()
+        elif lowercase_headers:
+            self._headers = {key.lower(): value for key, value in headers.items()}
+        else:
+            self._headers = headers
+        self._body: Any = _UNSET if body is None else body
+        self._json: Any = _UNSET
         self._path = path
         self._method = method
         self._raises_exceptions = raises_exceptions
@@ -61,10 +96,8 @@ class Request:
         Returns:
             Body.
         """
-        try:
-            return self._body
-        except AttributeError:
-            return None
+        body = self._body
+        return None if body is _UNSET else body
 
     async def json(self) -> Any:
         """JSON body.
@@ -72,17 +105,11 @@ class Request:
         Returns:
             JSON deserialized body.
         """
-        try:
-            return self._json
-        except AttributeError:
+        if self._json is _UNSET:
             body = await self.body()
-            if body is not None:
-                try:
-                    body = loads(body)
-                except JSONDecodeError:
-                    pass
-            self._json: Any = body
-            return body
+            value = _loads_json(body)
+            self._json = body if value is _UNSET else value
+        return self._json
 
     @property
     def server_id(self) -> str | None:
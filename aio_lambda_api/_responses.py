@@ -1,6 +1,8 @@
 """Responses."""
 from __future__ import annotations
-from typing import Any, Union
+from functools import lru_cache
+from sys import intern
+from typing import Any, Final, Union
 from jhalog import LogEvent
 from aio_lambda_api.json import dumps
 from aio_lambda_api.status import get_status_message
@@ -8,6 +10,11 @@ from aio_lambda_api.status import get_status_message
 
 Body = Union[str, bytes, bytearray, memoryview]
 
+# Headers keys shared by all responses
+_CONTENT_LENGTH: Final = intern("content-length")
+_CONTENT_TYPE: Final = intern("content-type")
+_X_REQUEST_ID: Final = intern("x-request-id")
+
 
 class Response:
     """Response."""
@@ -15,7 +22,7 @@ class Response:
     _MEDIA_TYPE: str | None = None
     charset = "utf-8"
 
-    __slots__ = ["_content", "_status_code", "_headers", "_media_type"]
+    __slots__ = ["_content", "_status_code", "_headers", "_media_type", "_event"]
 
     def __init__(
         self,
@@ -24,11 +31,16 @@ class Response:
         headers: dict[str, str] | None = None,
         media_type: str | None = None,
     ) -> None:
+        self._event = LogEvent.from_context()
         self._content = content
         self._media_type = media_type or self._MEDIA_TYPE
         self.status_code = status_code
-        self._headers = headers or dict()
-        self._headers["x-request-id"] = LogEvent.from_context().id
+        request_id = self._event.id
+        self._headers = (
+            {**headers, _X_REQUEST_ID: request_id}
+            if headers
+            else {_X_REQUEST_ID: request_id}
+        )
 
     @property
     def headers(self) -> dict[str, str]:
@@ -57,7 +69,7 @@ class Response:
         """
         if self._content is None and value == 200:
             value = 204
-        self._status_code = LogEvent.from_context().status_code = value
+        self._status_code = self._event.status_code = value
 
     @property
     def content(self) -> Any:
@@ -77,7 +89,7 @@ class Response:
         """
         self._content = value
         if value is not None and self._status_code == 204:
-            self._status_code = LogEvent.from_context().status_code = 200
+            self._status_code = self._event.status_code = 200
 
     async def _render(self, content: Any) -> Body:
         """Render content for response in str or bytes.
@@ -90,23 +102,36 @@ class Response:
         """
         return content  # type: ignore
 
+    async def _render_default(self, status_code: int) -> tuple[Body, str]:
+        """Render default content for error response without content.
+
+        Args:
+            status_code: Status code.
+
+        Returns:
+            Rendered content, content length header value.
+        """
+        self._content = dict(detail=get_status_message(status_code))
+        body = await self._render(self._content)
+        return body, _content_length(body, self.charset)
+
     async def body(self) -> Body | None:
         """Body.
 
         Returns:
             Rendered body.
         """
-        body: Body | None = None
-
-        if self._content is None and self._status_code >= 400:
-            self._content = dict(detail=get_status_message(self._status_code))
-
         if self._content is not None:
             body = await self._render(self._content)
-            self._headers["content-length"] = str(len(body))
-            if self._media_type is not None:
-                self._headers["content-type"] = self._media_type
-
+            content_length = _content_length(body, self.charset)
+        elif self._status_code >= 400:
+            body, content_length = await self._render_default(self._status_code)
+        else:
+            return None
+
+        self._headers[_CONTENT_LENGTH] = content_length
+        if self._media_type is not None:
+            self._headers[_CONTENT_TYPE] = self._media_type
         return body
 
 
@@ -125,3 +150,50 @@ class JSONResponse(Response):
             JSON content.
         """
         return dumps(content)
+
+    async def _render_default(self, status_code: int) -> tuple[Body, str]:
+        """Render default content for error response without content.
+
+        Args:
+            status_code: Status code.
+
+        Returns:
+            JSON content, content length header value.
+        """
+        if type(self)._render is not JSONResponse._render:
+            # Subclass with its own rendering
+            return await Response._render_default(self, status_code)
+        self._content = dict(detail=get_status_message(status_code))
+        return _default_json_body(status_code)
+
+
+def _content_length(body: Body, charset: str) -> str:
+    """Content length header value.
+
+    Args:
+        body: Rendered body.
+        charset: Charset used to encode str body.
+
+    Returns:
+        Body length in bytes.
+    """
+    return str(
+        # "isascii" is a constant time check
+        len(body.encode(charset))
+        if isinstance(body, str) and not body.isascii()
+        else len(body)
+    )
+
+
+@lru_cache(maxsize=64)
+def _default_json_body(status_code: int) -> tuple[str, str]:
+    """Default JSON body of error responses.
+
+    Args:
+        status_code: Status code.
+
+    Returns:
+        JSON content, content length header value.
+    """
+    body = dumps(dict(detail=get_status_message(status_code)))
+    return body, _content_length(body, Response.charset)
@@ -27,9 +27,17 @@ except ImportError:
 
 
 class HTTPException(Exception):
-    """Exception returned as result to client with an HTTP return code."""
+    """Exception returned as result to client with an HTTP return code.
 
-    __slots__ = ["status_code", "_error_detail", "_detail", "headers"]
+    Args:
+        status_code: HTTP status code.
+        detail: Error detail, returned to caller.
+        headers: HTTP headers.
+        error_detail: Internal error details. Shown in logs, but not returned to
+            caller. Default to "detail".
+    """
+
+    __slots__ = ["status_code", "detail", "error_detail", "headers"]
 
     def __init__(
         self,
@@ -40,31 +48,11 @@ class HTTPException(Exception):
         error_detail: _Any | None = None,
     ) -> None:
         self.status_code = int(status_code)
-        self._detail = detail
+        self.detail = detail
         self.headers = headers
-        self._error_detail = error_detail
-        Exception.__init__(self)
-
-    @property
-    def detail(self) -> _Any:
-        """Error detail.
-
-        Returns:
-            Error detail.
-        """
-        return self._detail
-
-    @property
-    def error_detail(self) -> str | None:
-        """Internal error details.
-
-        Shown in logs, but not returned to caller.
-
-        Returns:
-            Message.
-        """
-        if self._error_detail:
-            return str(self._error_detail)
-        elif self._detail:
-            return str(self._detail)
-        return None
+        if error_detail:
+            self.error_detail: str | None = str(error_detail)
+        elif detail:
+            self.error_detail = str(detail)
+        else:
+            self.error_detail = None
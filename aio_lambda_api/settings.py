@@ -1,5 +1,6 @@
 """Settings."""
 from os import getenv as _getenv
+from sys import intern as _intern
 
 # Default lambda function timeout (seconds)
 FUNCTION_TIMEOUT = int(_getenv("FUNCTION_TIMEOUT", 30))
@@ -11,4 +12,4 @@ CONNECTION_TIMEOUT = int(_getenv("CONNECTION_TIMEOUT", 5))
 READ_TIMEOUT = int(_getenv("READ_TIMEOUT", 15))
 
 # Backend to use
-BACKEND = _getenv("AIO_LAMBDA_API_BACKEND", "aws_lambda")
+BACKEND = _intern(_getenv("AIO_LAMBDA_API_BACKEND", "aws_lambda"))
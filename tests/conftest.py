@@ -1,15 +1,26 @@
 """Pytest configuration."""
 from __future__ import annotations
-from base64 import b64encode
-from json import dumps
+from binascii import b2a_base64
+from aio_lambda_api.json import dumps, loads
+from itertools import count
 from typing import Any
-from secrets import token_hex
+
+_REQUEST_IDS = count()
+
+
+def _request_id() -> str:
+    """Generate a unique request ID.
+
+    Returns:
+        Request ID.
+    """
+    return f"{next(_REQUEST_IDS):016x}"
 
 
 class _Context:
     """Lambda context."""
 
-    aws_request_id = token_hex(8)
+    aws_request_id = _request_id()
 
 
 def init_event_context(
@@ -34,7 +45,7 @@ def init_event_context(
     context = _Context()
     encoded = False
     if isinstance(body, bytes):
-        body = b64encode(body).decode()
+        body = b2a_base64(body, newline=False).decode("ascii")
         encoded = True
     elif body is not None:
         body = dumps(body)
@@ -51,7 +62,7 @@ def init_event_context(
                 "resourcePath": path,
                 "httpMethod": method,
                 "path": path,
-                "requestId": token_hex(8),
+                "requestId": _request_id(),
             },
             "body": body,
             "isBase64Encoded": encoded,
@@ -66,7 +77,7 @@ def init_event_context(
                     "method": method,
                     "path": path,
                 },
-                "requestId": token_hex(8),
+                "requestId": _request_id(),
             },
             "isBase64Encoded": encoded,
             "body": body,
@@ -74,3 +85,15 @@ def init_event_context(
     else:
         raise ValueError("Invalid version.")
     return event, context
+
+
+def parse_logs(out: str) -> list[Any]:
+    """Parse JSON logs lines with a single JSON parser call.
+
+    Args:
+        out: Captured output.
+
+    Returns:
+        Logs.
+    """
+    return loads("[" + out.strip().replace("\n", ",") + "]")  # type: ignore
@@ -1,8 +1,8 @@
 """AWS Lambda tests."""
 from base64 import b64decode
-from json import loads, dumps
+from aio_lambda_api.json import loads, dumps, JSONDecodeError
 import pytest
-from conftest import init_event_context
+from conftest import init_event_context, parse_logs
 from _pytest.capture import CaptureFixture
 
 
@@ -139,6 +139,7 @@ def test_routing(capsys: CaptureFixture[str]) -> None:
     log = loads(capsys.readouterr().out)
     assert resp["statusCode"] == "404", resp["body"]
     assert loads(resp["body"]) == {"detail": "Not Found"}
+    assert resp["headers"]["content-length"] == str(len(resp["body"]))
     assert log["level"] == "warning"
     assert log["status_code"] == 404
     assert log["path"] == "/not_exists"
@@ -162,6 +163,28 @@ def test_routing(capsys: CaptureFixture[str]) -> None:
     assert log["method"] == "PUT"
 
 
+def test_routing_str_subclass() -> None:
+    """Tests routing with paths defined as str subclasses."""
+    from enum import Enum
+    from aio_lambda_api import Handler
+
+    class Paths(str, Enum):
+        """Paths."""
+
+        ITEMS = "/items"
+
+    handler = Handler()
+
+    @handler.get(Paths.ITEMS)
+    async def get() -> str:
+        """Get."""
+        return "items"
+
+    resp = handler(*init_event_context("/items"))
+    assert resp["statusCode"] == "200", resp["body"]
+    assert loads(resp["body"]) == "items"
+
+
 def test_exception_handling(capsys: CaptureFixture[str]) -> None:
     """Tests exception handling."""
     from aio_lambda_api import Handler, HTTPException
@@ -295,6 +318,27 @@ def test_inject_request() -> None:
     assert resp["statusCode"] == "204", resp["body"]
 
 
+def test_headers() -> None:
+    """Tests request headers."""
+    from aio_lambda_api import Handler, Request
+
+    handler = Handler()
+
+    @handler.get("/")
+    async def get(request: Request) -> str:
+        """Get."""
+        assert request.headers["x-request-id"]
+        return request.headers["user-agent"]
+
+    resp = handler(*init_event_context(headers={"User-Agent": "test"}, version=1))
+    assert resp["statusCode"] == "200", resp["body"]
+    assert loads(resp["body"]) == "test"
+
+    resp = handler(*init_event_context(headers={"user-agent": "test"}))
+    assert resp["statusCode"] == "200", resp["body"]
+    assert loads(resp["body"]) == "test"
+
+
 def test_inject_response() -> None:
     """Tests Response object injection."""
     from aio_lambda_api import Handler, Response
@@ -345,6 +389,86 @@ def test_binary_body() -> None:
     assert resp["headers"]["content-length"] == str(len(data))
 
 
+def test_non_json_body() -> None:
+    """Tests non JSON bodies are returned as bytes by JSON body."""
+    from aio_lambda_api import Handler, Request
+
+    handler = Handler()
+    expected = b""
+
+    @handler.post("/")
+    async def post(request: Request) -> None:
+        """Check JSON body."""
+        assert await request.json() == expected
+
+    for text in ("a=1&b=2", "[invalid"):
+        event, context = init_event_context(method="POST")
+        # Raw text body, not JSON serialized
+        event["body"] = text
+        expected = text.encode()
+        resp = handler(event, context)
+        assert resp["statusCode"] == "204", resp["body"]
+
+    expected = b"\x00binary"
+    resp = handler(*init_event_context(body=expected, method="POST"))
+    assert resp["statusCode"] == "204", resp["body"]
+
+
+def test_content_length() -> None:
+    """Tests content length of non ASCII body."""
+    from aio_lambda_api import Handler
+
+    handler = Handler()
+
+    @handler.get("/")
+    async def get() -> str:
+        """Get."""
+        return "é"
+
+    resp = handler(*init_event_context())
+    assert resp["statusCode"] == "200", resp["body"]
+    assert resp["headers"]["content-length"] == str(len(resp["body"].encode()))
+
+
+def test_default_body() -> None:
+    """Tests default body of error responses without content."""
+    from typing import Any
+    from aio_lambda_api import Handler, JSONResponse
+
+    handler = Handler()
+
+    class TextResponse(JSONResponse):
+        """JSON response with custom rendering."""
+
+        _MEDIA_TYPE = "text/plain"
+
+        async def _render(self, content: Any) -> str:
+            """Render content as text."""
+            return str(content["detail"])
+
+    @handler.get("/json")
+    async def get_json() -> JSONResponse:
+        """Get JSON."""
+        return JSONResponse(status_code=404)
+
+    @handler.get("/text")
+    async def get_text() -> TextResponse:
+        """Get text."""
+        return TextResponse(status_code=404)
+
+    for _ in range(2):
+        resp = handler(*init_event_context("/json"))
+        assert resp["statusCode"] == "404", resp["body"]
+        assert loads(resp["body"]) == {"detail": "Not Found"}
+        assert resp["headers"]["content-length"] == str(len(resp["body"]))
+
+    resp = handler(*init_event_context("/text"))
+    assert resp["statusCode"] == "404", resp["body"]
+    assert resp["body"] == "Not Found"
+    assert resp["headers"]["content-length"] == str(len(resp["body"]))
+    assert resp["headers"]["content-type"] == "text/plain"
+
+
 def test_boto3_config() -> None:
     """Test run async functions."""
     import aioboto3
@@ -411,7 +535,7 @@ def test_batch(capsys: CaptureFixture[str]) -> None:
         ]
     )
     resp = handler(sqs_event, context)
-    logs = [loads(line.strip()) for line in capsys.readouterr().out.splitlines()]
+    logs = parse_logs(capsys.readouterr().out)
     assert sorted(item["itemIdentifier"] for item in resp["batchItemFailures"]) == [
         "2",
         "3",
@@ -426,14 +550,33 @@ def test_batch(capsys: CaptureFixture[str]) -> None:
         ]
     )
     resp = handler(sqs_event, context)
-    logs = [loads(line.strip()) for line in capsys.readouterr().out.splitlines()]
+    logs = parse_logs(capsys.readouterr().out)
     assert resp is None, resp
     assert [log["status_code"] for log in logs] == [204, 204, 204], logs
 
+    sqs_event = dict(Records=[dict(messageId="1", body=req400, eventSource="aws:sqs")])
+    resp = handler(sqs_event, context)
+    logs = parse_logs(capsys.readouterr().out)
+    assert [item["itemIdentifier"] for item in resp["batchItemFailures"]] == ["1"]
+    assert [log["status_code"] for log in logs] == [400], logs
+
     sqs_event = dict(Records=[])
     resp = handler(sqs_event, context)
     assert resp is None, resp
 
+    # Each record body is parsed on its own: a record that is not a valid JSON
+    # document on its own can never be merged with its neighbours, even if joined
+    # bodies form a valid array of one item per record: [{"a":",","b":1},3]
+    sqs_event = dict(
+        Records=[
+            dict(messageId="1", body='{"a":"', eventSource="aws:sqs"),
+            dict(messageId="2", body='","b":1},3', eventSource="aws:sqs"),
+        ]
+    )
+    with pytest.raises(JSONDecodeError):
+        handler(sqs_event, context)
+    capsys.readouterr()
+
     # SNS
     sns_event = dict(
         Records=[
@@ -443,10 +586,18 @@ def test_batch(capsys: CaptureFixture[str]) -> None:
         ]
     )
     resp = handler(sns_event, context)
-    logs = [loads(line.strip()) for line in capsys.readouterr().out.splitlines()]
+    logs = parse_logs(capsys.readouterr().out)
     assert resp is None, resp
     assert [log["status_code"] for log in logs] == [204, 204, 204], logs
 
+    sns_event = dict(
+        Records=[dict(messageId="1", Sns=dict(Message=req500), eventSource="aws:sns")]
+    )
+    with pytest.raises(ValueError):
+        handler(sns_event, context)
+    logs = parse_logs(capsys.readouterr().out)
+    assert [log["status_code"] for log in logs] == [500], logs
+
     # MQ
     mq_event = dict(
         eventSource="aws:mq",
@@ -457,6 +608,10 @@ def test_batch(capsys: CaptureFixture[str]) -> None:
         ],
     )
     resp = handler(mq_event, context)
-    logs = [loads(line.strip()) for line in capsys.readouterr().out.splitlines()]
+    logs = parse_logs(capsys.readouterr().out)
     assert resp is None, resp
     assert [log["status_code"] for log in logs] == [204, 204, 204], logs
+
+    # Unsupported event source
+    with pytest.raises(NotImplementedError):
+        handler(dict(eventSource="aws:unsupported"), context)
@@ -12,3 +12,37 @@ def test_run_async() -> None:
         return 1
 
     assert Handler().run_async(test()) == 1
+
+
+def test_unsupported_backend() -> None:
+    """Test unsupported backend."""
+    import pytest
+    from aio_lambda_api import Handler
+
+    with pytest.raises(NotImplementedError):
+        Handler(backend="unsupported")
+
+
+def test_serialize_responses() -> None:
+    """Test default batch responses serialization."""
+    from typing import Any
+    from aio_lambda_api import Handler
+    from aio_lambda_api._backends import BackendBase
+
+    class Backend(BackendBase):
+        """Backend."""
+
+        async def parse_request(self, *args: Any, **kwargs: Any) -> Any:
+            """Parse request."""
+
+        async def serialize_response(self, response: Any, request: Any) -> Any:
+            """Serialize response."""
+            return response, request
+
+    backend = Backend()
+    run_async = Handler().run_async
+    items: list[Any] = [("resp1", "req1")]
+    assert run_async(backend.serialize_responses(iter(items))) == items
+
+    items = [("resp1", "req1"), ("resp2", "req2"), ("resp3", "req3")]
+    assert run_async(backend.serialize_responses(iter(items))) == items